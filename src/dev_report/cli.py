@@ -1,18 +1,20 @@
 """CLI entrypoint for dev-report."""
 
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import multiprocessing
 import sys
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .discovery import find_repos, get_author_emails, load_config
-from .git_stats import RepoStats, analyze_repo
-from .github_prs import RepoPRs, fetch_prs, is_gh_available
-from .report import PeriodStats, render_report
+from .git_stats import RepoStats, analyze_repo_uncached, head_updated_since, load_cached_analysis
+from .github_prs import PR_BATCH_SIZE, RepoPRs, fetch_prs_batch, get_github_remote, is_gh_available
+from .report import PeriodStats, render_json, render_report
 
 
 def parse_args() -> argparse.Namespace:
@@ -46,6 +48,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip fetching PR statistics (faster)",
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON instead of formatted output",
+    )
 
     return parser.parse_args()
 
@@ -71,63 +78,94 @@ def get_periods(args: argparse.Namespace) -> list[tuple[str, datetime]]:
     return all_periods
 
 
+def count_since(neg_timestamps: list[float], since: datetime) -> int:
+    """Count leading items at or after since in a newest-first list.
+
+    Takes negated timestamps so the list is ascending for bisect.
+    """
+    return bisect_right(neg_timestamps, -since.timestamp())
+
+
 def analyze_repos_parallel(
     repos: list[Path],
     author_emails: list[str],
     since: datetime,
-    console: Console,
+    progress: Progress,
 ) -> list[RepoStats]:
     """Analyze multiple repos in parallel."""
     results: list[RepoStats] = []
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        task = progress.add_task("Analyzing repos...", total=len(repos))
-
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            futures = {
-                executor.submit(analyze_repo, repo, author_emails, since): repo
-                for repo in repos
-            }
-
-            for future in as_completed(futures):
-                results.append(future.result())
-                progress.advance(task)
+    if not repos:
+        return results
+
+    task = progress.add_task("Analyzing repos...", total=len(repos))
+
+    # Cache hits are a few file reads, answer them here and only send the
+    # misses to git
+    misses: list[Path] = []
+    for repo in repos:
+        cached = load_cached_analysis(repo, author_emails, since)
+        if cached:
+            results.append(cached)
+            progress.advance(task)
+        else:
+            misses.append(repo)
+
+    # Starting worker processes costs more than a couple of git logs
+    if len(misses) <= 2:
+        for repo in misses:
+            results.append(analyze_repo_uncached(repo, author_emails, since))
+            progress.advance(task)
+        return results
+
+    # Parsing git log output holds the GIL, so use processes. We're already
+    # multi-threaded here (progress display, PR fetching), where fork() can
+    # deadlock the child, so start workers from a clean process instead.
+    # Workers mostly wait on git, so the CPU count doesn't cap them.
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(
+        max_workers=min(8, len(misses)),
+        mp_context=multiprocessing.get_context(start_method),
+    ) as executor:
+        futures = {
+            executor.submit(analyze_repo_uncached, repo, author_emails, since): repo
+            for repo in misses
+        }
+
+        for future in as_completed(futures):
+            results.append(future.result())
+            progress.advance(task)
 
     return results
 
 
 def fetch_prs_parallel(
-    repos: list[Path],
+    github_repos: list[tuple[Path, str, str]],
     since: datetime,
-    console: Console,
+    progress: Progress,
 ) -> list[RepoPRs]:
-    """Fetch PRs for multiple repos in parallel."""
-    if not is_gh_available():
-        return [RepoPRs(repo_path=r, repo_name=r.name, owner="", prs_opened=[], prs_merged=[]) for r in repos]
-
+    """Fetch PRs for (path, owner, name) repos, one gh request per chunk."""
     results: list[RepoPRs] = []
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        task = progress.add_task("Fetching PRs...", total=len(repos))
+    chunks = [
+        github_repos[i:i + PR_BATCH_SIZE]
+        for i in range(0, len(github_repos), PR_BATCH_SIZE)
+    ]
+
+    if not chunks or not is_gh_available():
+        return results
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {
-                executor.submit(fetch_prs, repo, since): repo
-                for repo in repos
-            }
+    task = progress.add_task("Fetching PRs...", total=len(chunks))
 
-            for future in as_completed(futures):
-                results.append(future.result())
+    # Each chunk is a single gh call, only overlap them when there are many
+    if len(chunks) <= 2:
+        for chunk in chunks:
+            results.extend(fetch_prs_batch(chunk, since))
+            progress.advance(task)
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for batch in executor.map(fetch_prs_batch, chunks, [since] * len(chunks)):
+                results.extend(batch)
                 progress.advance(task)
 
     return results
@@ -136,7 +174,9 @@ def fetch_prs_parallel(
 def main() -> None:
     """Main entry point."""
     args = parse_args()
-    console = Console()
+
+    # Keep stdout clean for JSON, status and progress go to stderr
+    console = Console(stderr=args.json)
 
     # Load config and discover repos
     config = load_config()
@@ -151,6 +191,9 @@ def main() -> None:
 
     if not repos:
         console.print("[yellow]No git repositories found.[/yellow]")
+        if args.json:
+            # Scripts still get a valid (empty) report
+            sys.stdout.write(render_json([], []) + "\n")
         sys.exit(0)
 
     console.print(f"[dim]Found {len(repos)} repositories[/dim]")
@@ -168,46 +211,78 @@ def main() -> None:
     # Find the earliest date we need
     earliest_since = min(since for _, since in periods)
 
-    # Analyze all repos once with the earliest date
-    all_repo_stats = analyze_repos_parallel(repos, author_emails, earliest_since, console)
+    # Repos whose HEAD hasn't moved since the earliest date can't have new
+    # commits, so skip them without running git at all
+    active_repos = [r for r in repos if head_updated_since(r, earliest_since)]
 
-    # Fetch PRs unless --no-prs flag is set
-    if args.no_prs:
-        all_repo_prs = [RepoPRs(repo_path=r, repo_name=r.name, owner="", prs_opened=[], prs_merged=[]) for r in repos]
-    else:
-        all_repo_prs = fetch_prs_parallel(repos, earliest_since, console)
+    # Only GitHub repos are fetched (the rest have no PRs to count), once
+    # per remote even if cloned twice
+    github_repos: list[tuple[Path, str, str]] = []
+    if not args.no_prs:
+        remotes: dict[tuple[str, str], Path] = {}
+        for repo in repos:
+            remote = get_github_remote(repo)
+            if remote:
+                remotes.setdefault(remote, repo)
 
-        # Collect warnings
-        for pr_result in all_repo_prs:
-            if pr_result.error:
-                warnings.append(pr_result.error)
-                break  # Only show first warning
+        github_repos = [(repo, owner, name) for (owner, name), repo in remotes.items()]
+
+    # Analyze all active repos once with the earliest date, fetching PRs
+    # (unless --no-prs flag is set) at the same time under one display
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stats_future = executor.submit(
+                analyze_repos_parallel, active_repos, author_emails, earliest_since, progress,
+            )
+            prs_future = executor.submit(fetch_prs_parallel, github_repos, earliest_since, progress)
+
+            all_repo_stats = stats_future.result()
+            all_repo_prs = prs_future.result()
+
+    # Results arrive in completion order, sort them so output is stable
+    all_repo_stats.sort(key=lambda r: r.path)
+    all_repo_prs.sort(key=lambda r: r.repo_path)
+
+    # Collect warnings
+    for pr_result in all_repo_prs:
+        if pr_result.error:
+            warnings.append(pr_result.error)
+            break  # Only show first warning
+
+    # Build period stats by filtering results. Commits and PRs are sorted
+    # newest first, so each period is a prefix found by bisecting on dates.
+    commit_dates = [[-c.authored_date.timestamp() for c in r.commits] for r in all_repo_stats]
+    opened_dates = [[-p.created_at.timestamp() for p in r.prs_opened] for r in all_repo_prs]
+    merged_dates = [[-p.merged_at.timestamp() for p in r.prs_merged] for r in all_repo_prs]
 
-    # Build period stats by filtering results
     period_stats: list[PeriodStats] = []
 
     for period_name, since in periods:
         # Filter commits to this period
         filtered_repo_stats = []
-        for repo_stat in all_repo_stats:
-            filtered_commits = [c for c in repo_stat.commits if c.authored_date >= since]
+        for repo_stat, dates in zip(all_repo_stats, commit_dates):
             filtered = RepoStats(
                 path=repo_stat.path,
                 name=repo_stat.name,
-                commits=filtered_commits,
+                commits=repo_stat.commits[:count_since(dates, since)],
                 error=repo_stat.error,
             )
             filtered_repo_stats.append(filtered)
 
         # Filter PRs to this period
         filtered_repo_prs = []
-        for repo_pr in all_repo_prs:
+        for repo_pr, opened, merged in zip(all_repo_prs, opened_dates, merged_dates):
             filtered = RepoPRs(
                 repo_path=repo_pr.repo_path,
                 repo_name=repo_pr.repo_name,
                 owner=repo_pr.owner,
-                prs_opened=[p for p in repo_pr.prs_opened if p.created_at >= since],
-                prs_merged=[p for p in repo_pr.prs_merged if p.merged_at and p.merged_at >= since],
+                prs_opened=repo_pr.prs_opened[:count_since(opened, since)],
+                prs_merged=repo_pr.prs_merged[:count_since(merged, since)],
                 error=repo_pr.error,
             )
             filtered_repo_prs.append(filtered)
@@ -219,7 +294,10 @@ def main() -> None:
         ))
 
     # Render the report
-    render_report(console, period_stats, warnings)
+    if args.json:
+        sys.stdout.write(render_json(period_stats, warnings) + "\n")
+    else:
+        render_report(console, period_stats, warnings)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,26 @@
 """Repository discovery and configuration loading."""
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
+import os
+import re
 import subprocess
+import tempfile
 import tomllib
 
 
 CONFIG_PATH = Path.home() / ".config" / "dev-report" / "config.toml"
+CACHE_DIR = Path.home() / ".cache" / "dev-report"
+
+# Heavy directories that never need to be searched for repos
+SKIP_DIRS = frozenset({
+    "node_modules", ".venv", "venv", "__pycache__", "target",
+    "build", "dist", ".tox", ".mypy_cache",
+})
 
 
 @dataclass
@@ -36,6 +49,24 @@ def load_config() -> Config:
         raise SystemExit(f"Error parsing config file {CONFIG_PATH}: {e}")
 
 
+def write_cache_file(path: Path, content: str) -> None:
+    """Write a cache file atomically; caching is best effort, errors are ignored."""
+    tmp_name: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as f:
+            tmp_name = f.name
+            f.write(content)
+        os.replace(tmp_name, path)
+    except OSError:
+        # Don't leave the temp file behind
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
 def get_git_user_email() -> str | None:
     """Get the user's email from git config."""
     try:
@@ -67,39 +98,166 @@ def expand_path(path: str) -> Path:
     return Path(path).expanduser().resolve()
 
 
-def matches_pattern(path: Path, pattern: str) -> bool:
-    """Check if path matches a glob-like pattern."""
-    pattern_expanded = str(expand_path(pattern))
-    path_str = str(path)
+@lru_cache(maxsize=None)
+def compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile glob-like patterns into a single regex matching any of them."""
+    translated = []
+    for pattern in patterns:
+        pattern_expanded = str(expand_path(pattern))
 
-    # Handle ** patterns
-    if "**" in pattern_expanded:
-        pattern_expanded = pattern_expanded.replace("**", "*")
+        # Handle ** patterns
+        if "**" in pattern_expanded:
+            pattern_expanded = pattern_expanded.replace("**", "*")
 
-    return fnmatch(path_str, pattern_expanded)
+        translated.append(translate(pattern_expanded))
 
+    # Matches nothing when there are no patterns
+    return re.compile("|".join(translated) or "(?!)")
 
-def find_repos(root: Path, config: Config) -> list[Path]:
-    """Find all git repositories under root, applying config filters."""
-    root = root.resolve()
-    repos: list[Path] = []
 
-    for git_dir in root.rglob(".git"):
-        if not git_dir.is_dir():
-            continue
+def matches_any(path: Path, patterns: list[str]) -> bool:
+    """Check if path matches any of the glob-like patterns."""
+    return compile_patterns(tuple(patterns)).match(str(path)) is not None
+
 
-        repo_path = git_dir.parent
+def resolve_git_dir(repo_path: Path) -> Path | None:
+    """Get a working tree's git directory, following `gitdir:` files."""
+    dot_git = repo_path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+
+    # Worktrees and submodules have a .git file pointing elsewhere
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+
+    if not content.startswith("gitdir:"):
+        return None
 
-        # Apply include filter (if specified, repo must match at least one)
-        if config.include:
-            if not any(matches_pattern(repo_path, p) for p in config.include):
+    git_dir = Path(content.removeprefix("gitdir:").strip())
+    return git_dir if git_dir.is_absolute() else (repo_path / git_dir).resolve()
+
+
+def resolve_common_dir(git_dir: Path) -> Path:
+    """Get the git directory holding config and refs (differs for worktrees)."""
+    try:
+        common = (git_dir / "commondir").read_text().strip()
+    except OSError:
+        return git_dir
+
+    return (git_dir / common).resolve()
+
+
+def scan_dir(directory: Path, config: Config) -> tuple[bool, list[Path]]:
+    """Scan one directory, returning whether it's a repo and subdirs to visit."""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return False, []
+
+    # .git is a directory, or a file for worktrees and submodules
+    if any(entry.name == ".git" for entry in entries):
+        return True, []
+
+    subdirs: list[Path] = []
+    for entry in entries:
+        # Heavy directories are pruned, unless they are a repo themselves
+        if entry.name in SKIP_DIRS and not os.path.lexists(os.path.join(entry.path, ".git")):
+            continue
+
+        try:
+            if not entry.is_dir(follow_symlinks=False):
                 continue
+        except OSError:
+            continue
+
+        path = Path(entry.path)
 
-        # Apply exclude filter
+        # Prune excluded directories along with everything below them
         if config.exclude:
-            if any(matches_pattern(repo_path, p) for p in config.exclude):
+            if matches_any(path, config.exclude):
                 continue
 
-        repos.append(repo_path)
+        subdirs.append(path)
+
+    return False, subdirs
+
+
+def is_wanted_repo(repo_path: Path, config: Config) -> bool:
+    """Apply config include/exclude filters to a discovered repo."""
+    # Apply include filter (if specified, repo must match at least one)
+    if config.include:
+        if not matches_any(repo_path, config.include):
+            return False
+
+    # Apply exclude filter
+    if config.exclude:
+        if matches_any(repo_path, config.exclude):
+            return False
+
+    return True
+
+
+def walk_repos(start: Path, config: Config) -> list[Path]:
+    """Depth-first search for repos under start, without entering found repos."""
+    repos: list[Path] = []
+    pending = deque([start])
+
+    while pending:
+        directory = pending.pop()
+        is_repo, subdirs = scan_dir(directory, config)
+
+        if is_repo:
+            if is_wanted_repo(directory, config):
+                repos.append(directory)
+        else:
+            pending.extend(subdirs)
+
+    return repos
+
+
+def dedupe_worktrees(repos: list[Path]) -> list[Path]:
+    """Keep one working tree per repository, preferring the main checkout.
+
+    Linked worktrees share history with their main checkout, so analyzing
+    both would count the same commits twice.
+    """
+    seen: set[Path] = set()
+    unique: list[Path] = []
+
+    # Main checkouts (with a .git directory) first
+    for repo in sorted(repos, key=lambda r: (not (r / ".git").is_dir(), r)):
+        git_dir = resolve_git_dir(repo)
+        common_dir = resolve_common_dir(git_dir) if git_dir else repo
+
+        if common_dir not in seen:
+            seen.add(common_dir)
+            unique.append(repo)
+
+    return sorted(unique)
+
+
+def find_repos(root: Path, config: Config) -> list[Path]:
+    """Find all git repositories under root, applying config filters.
+
+    Doesn't descend into repos once found (so nested repos and submodules
+    are skipped), nor into SKIP_DIRS or directories matching an exclude
+    pattern. Linked worktrees of an already found repo are dropped.
+    Top-level subdirectories are walked in parallel.
+    """
+    root = root.resolve()
+
+    is_repo, subdirs = scan_dir(root, config)
+    if is_repo:
+        return [root] if is_wanted_repo(root, config) else []
+
+    repos: list[Path] = []
+
+    # scandir/stat release the GIL, so threads overlap the directory reads
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for found in executor.map(walk_repos, subdirs, [config] * len(subdirs)):
+            repos.extend(found)
 
-    return sorted(repos)
+    return dedupe_worktrees(repos)
@@ -1,11 +1,15 @@
-"""Git repository statistics using gitpython."""
+"""Git repository statistics via git log."""
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
+import hashlib
+import json
+import subprocess
+import tempfile
 
-from git import Repo
-from git.exc import InvalidGitRepositoryError
+from .discovery import CACHE_DIR, resolve_common_dir, resolve_git_dir, write_cache_file
 
 
 @dataclass
@@ -23,7 +27,11 @@ class CommitInfo:
 
 @dataclass
 class RepoStats:
-    """Statistics for a single repository."""
+    """Statistics for a single repository.
+
+    Line/file totals are computed once on first access, so commits must be
+    complete by then.
+    """
 
     path: Path
     name: str
@@ -34,27 +42,183 @@ class RepoStats:
     def total_commits(self) -> int:
         return len(self.commits)
 
-    @property
+    @cached_property
     def lines_added(self) -> int:
         return sum(c.lines_added for c in self.commits)
 
-    @property
+    @cached_property
     def lines_removed(self) -> int:
         return sum(c.lines_removed for c in self.commits)
 
-    @property
+    @cached_property
     def files_changed(self) -> int:
         # This is an approximation - same file in multiple commits counts multiple times
         return sum(c.files_changed for c in self.commits)
 
 
-def get_commit_stats(commit) -> tuple[int, int, int]:
-    """Get lines added, removed, and files changed for a commit."""
+# Field/record separators for the git log format below
+COMMIT_MARKER = "\x02"
+FIELD_SEP = "\x01"
+
+
+def read_head(repo_path: Path) -> tuple[Path, str] | None:
+    """Read where HEAD points without running git.
+
+    Returns the common git dir and ref name (e.g. "refs/heads/main") for a
+    branch, or the worktree's git dir and the SHA for a detached HEAD.
+    """
+    git_dir = resolve_git_dir(repo_path)
+    if not git_dir:
+        return None
+
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    if head.startswith("ref:"):
+        return resolve_common_dir(git_dir), head.removeprefix("ref:").strip()
+
+    # Detached HEAD holds the SHA itself
+    return (git_dir, head) if head else None
+
+
+def read_head_sha(repo_path: Path) -> str | None:
+    """Resolve HEAD to a commit SHA by reading ref files directly."""
+    head = read_head(repo_path)
+    if not head:
+        return None
+
+    directory, ref = head
+    if not ref.startswith("refs/"):
+        return ref
+
+    try:
+        return (directory / ref).read_text().strip() or None
+    except OSError:
+        pass
+
+    # Fall back to packed refs ("<sha> <ref>" lines)
+    try:
+        packed = (directory / "packed-refs").read_text()
+    except OSError:
+        return None
+
+    for line in packed.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+
+    # Branch without commits yet
+    return None
+
+
+def head_updated_since(repo_path: Path, since: datetime) -> bool:
+    """Check whether HEAD's ref file was written since a date.
+
+    A commit can't be newer than the ref pointing at it, so an older mtime
+    means there is nothing to report. Returns True when unsure.
+    """
+    head = read_head(repo_path)
+    if not head:
+        return True
+
+    directory, ref = head
+    if ref.startswith("refs/"):
+        candidates = [directory / ref, directory / "packed-refs"]
+    else:
+        # Detached HEAD is rewritten on every commit
+        candidates = [directory / "HEAD"]
+
+    for path in candidates:
+        try:
+            return path.stat().st_mtime >= since.timestamp()
+        except OSError:
+            continue
+
+    return True
+
+
+def cache_path(repo_path: Path, author_emails: list[str]) -> Path:
+    """Get the cache file for a repo and set of authors."""
+    key = repr((str(repo_path), tuple(sorted(e.lower() for e in author_emails))))
+    return CACHE_DIR / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+
+
+def load_cached_stats(
+    repo_path: Path,
+    author_emails: list[str],
+    since: datetime,
+    head_sha: str,
+) -> RepoStats | None:
+    """Load cached stats if HEAD is unchanged and the cache covers since."""
     try:
-        stats = commit.stats.total
-        return stats.get("insertions", 0), stats.get("deletions", 0), stats.get("files", 0)
-    except Exception:
-        return 0, 0, 0
+        with open(cache_path(repo_path, author_emails)) as f:
+            data = json.load(f)
+
+        if data["head"] != head_sha or datetime.fromisoformat(data["since"]) > since:
+            return None
+
+        # History is immutable, so a cache for an earlier since can be filtered
+        commits = [
+            CommitInfo(**{**c, "authored_date": datetime.fromisoformat(c["authored_date"])})
+            for c in data["commits"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    return RepoStats(
+        path=repo_path,
+        name=repo_path.name,
+        commits=[c for c in commits if c.authored_date >= since],
+    )
+
+
+def save_cached_stats(
+    stats: RepoStats,
+    author_emails: list[str],
+    since: datetime,
+    head_sha: str,
+) -> None:
+    """Write stats to the cache, replacing any previous entry atomically."""
+    data = {
+        "head": head_sha,
+        "since": since.isoformat(),
+        "commits": [
+            {**asdict(c), "authored_date": c.authored_date.isoformat()}
+            for c in stats.commits
+        ],
+    }
+
+    write_cache_file(cache_path(stats.path, author_emails), json.dumps(data))
+
+
+def load_cached_analysis(
+    repo_path: Path,
+    author_emails: list[str],
+    since: datetime,
+) -> RepoStats | None:
+    """Get cached stats for a repo if HEAD hasn't moved, without running git."""
+    head_sha = read_head_sha(repo_path)
+    if not head_sha:
+        return None
+
+    return load_cached_stats(repo_path, author_emails, since, head_sha)
+
+
+def analyze_repo_uncached(
+    repo_path: Path,
+    author_emails: list[str],
+    since: datetime,
+) -> RepoStats:
+    """Analyze a repo with git log and store the result in the cache."""
+    head_sha = read_head_sha(repo_path)
+    stats = read_commits(repo_path, author_emails, since)
+
+    if head_sha and not stats.error:
+        save_cached_stats(stats, author_emails, since, head_sha)
+
+    return stats
 
 
 def analyze_repo(
@@ -62,55 +226,126 @@ def analyze_repo(
     author_emails: list[str],
     since: datetime,
 ) -> RepoStats:
-    """Analyze a git repository for commits by specified authors since a date."""
-    stats = RepoStats(path=repo_path, name=repo_path.name)
+    """Analyze a git repository for commits by specified authors since a date.
 
-    try:
-        repo = Repo(repo_path)
-    except InvalidGitRepositoryError:
-        stats.error = "Not a valid git repository"
-        return stats
+    Results are cached per repo and reused while HEAD doesn't move.
+    """
+    cached = load_cached_analysis(repo_path, author_emails, since)
+    if cached:
+        return cached
 
-    if repo.bare:
-        stats.error = "Bare repository"
-        return stats
+    return analyze_repo_uncached(repo_path, author_emails, since)
+
+
+def read_commits(
+    repo_path: Path,
+    author_emails: list[str],
+    since: datetime,
+) -> RepoStats:
+    """Read commits by specified authors since a date from git log."""
+    stats = RepoStats(path=repo_path, name=repo_path.name)
 
     # Normalize author emails for comparison
     author_emails_lower = [e.lower() for e in author_emails]
 
-    try:
-        # Get commits since the date
-        for commit in repo.iter_commits(since=since.isoformat()):
-            commit_email = commit.author.email.lower() if commit.author.email else ""
-
-            # Filter by author
-            if author_emails_lower and commit_email not in author_emails_lower:
-                continue
-
-            # Get commit timestamp
-            authored_date = datetime.fromtimestamp(
-                commit.authored_date,
-                tz=timezone.utc,
+    # One git log for the whole range; --author is only a coarse pre-filter
+    # (substring match), exact email matching happens below
+    cmd = [
+        "git", "-C", str(repo_path), "log",
+        f"--since={since.isoformat()}",
+        *(f"--author={e}" for e in author_emails),
+        "--fixed-strings",
+        "--regexp-ignore-case",
+        "--no-merges",
+        # Count renames as delete + add, like the per-commit stats did
+        "--no-renames",
+        "--numstat",
+        f"--pretty=format:{COMMIT_MARKER}%H{FIELD_SEP}%ae{FIELD_SEP}%at{FIELD_SEP}%s",
+    ]
+
+    # Compare raw epoch seconds, only build datetimes for kept commits
+    since_ts = since.timestamp()
+
+    def emit(header: list[str], lines_added: int, lines_removed: int, files_changed: int) -> None:
+        sha, email, timestamp, subject = header
+        if author_emails_lower and email.lower() not in author_emails_lower:
+            return
+
+        # Skip if before our since date (--since filters on committer date)
+        authored_ts = int(timestamp)
+        if authored_ts < since_ts:
+            return
+
+        stats.commits.append(
+            CommitInfo(
+                sha=sha[:8],
+                message=subject[:80],
+                author_email=email,
+                authored_date=datetime.fromtimestamp(authored_ts, tz=timezone.utc),
+                lines_added=lines_added,
+                lines_removed=lines_removed,
+                files_changed=files_changed,
             )
+        )
 
-            # Skip if before our since date (iter_commits since can be approximate)
-            if authored_date < since:
-                continue
-
-            lines_added, lines_removed, files_changed = get_commit_stats(commit)
-
-            stats.commits.append(
-                CommitInfo(
-                    sha=commit.hexsha[:8],
-                    message=commit.message.split("\n")[0][:80],
-                    author_email=commit.author.email or "",
-                    authored_date=authored_date,
-                    lines_added=lines_added,
-                    lines_removed=lines_removed,
-                    files_changed=files_changed,
-                )
+    # stderr goes to a file so a flood of warnings can't fill the pipe and
+    # block git while we're still reading stdout
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                encoding="utf-8",
+                errors="replace",
             )
-    except Exception as e:
-        stats.error = str(e)
+        except FileNotFoundError:
+            stats.error = "git not found"
+            return stats
+
+        try:
+            header: list[str] | None = None
+            lines_added = lines_removed = files_changed = 0
+
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+
+                if line.startswith(COMMIT_MARKER):
+                    if header:
+                        emit(header, lines_added, lines_removed, files_changed)
+                    header = line[1:].split(FIELD_SEP, 3)
+                    lines_added = lines_removed = files_changed = 0
+                    continue
+
+                if not line:
+                    continue
+
+                # numstat row: added<TAB>removed<TAB>path ("-" for binary files)
+                added, removed, _ = line.split("\t", 2)
+                lines_added += int(added) if added != "-" else 0
+                lines_removed += int(removed) if removed != "-" else 0
+                files_changed += 1
+
+            if header:
+                emit(header, lines_added, lines_removed, files_changed)
+
+            if proc.wait() != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+                if "not a git repository" in stderr:
+                    stats.error = "Not a valid git repository"
+                # An empty repo has no HEAD yet - that's just zero commits
+                elif "does not have any commits" not in stderr:
+                    stats.error = stderr.strip() or f"git log exited with {proc.returncode}"
+        except Exception as e:
+            proc.kill()
+            stats.error = str(e)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+    # git log orders by committer date; callers rely on newest-first author dates
+    stats.commits.sort(key=lambda c: c.authored_date, reverse=True)
 
     return stats
@@ -1,14 +1,16 @@
 """GitHub PR fetching via gh CLI."""
 
+import configparser
 import json
+import os
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 import re
 
-from git import Repo
-from git.exc import InvalidGitRepositoryError
+from .discovery import CACHE_DIR, resolve_common_dir, resolve_git_dir, write_cache_file
 
 
 @dataclass
@@ -38,6 +40,49 @@ class RepoPRs:
 _gh_available: bool | None = None
 _gh_warning_shown: bool = False
 
+# GitHub remote URLs: git@github.com:owner/repo.git, https://github.com/owner/repo.git
+_SSH_RE = re.compile(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$")
+_HTTPS_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?$")
+
+# Seconds before a gh call is abandoned
+GH_TIMEOUT = 30
+
+# Marks a successful `gh auth status`, trusted for GH_AVAILABLE_TTL seconds.
+# Failures aren't cached so installing or logging into gh takes effect at once.
+GH_AVAILABLE_CACHE = CACHE_DIR / "gh_available"
+GH_AVAILABLE_TTL = 600
+
+# Environment passed through to gh: auth, config/keyring lookup and proxies
+GH_ENV_VARS = (
+    "HOME", "PATH", "USER", "USERPROFILE", "APPDATA", "LOCALAPPDATA", "SYSTEMROOT",
+    "GH_TOKEN", "GITHUB_TOKEN", "GH_ENTERPRISE_TOKEN", "GITHUB_ENTERPRISE_TOKEN",
+    "GH_HOST", "GH_CONFIG_DIR", "XDG_CONFIG_HOME", "XDG_RUNTIME_DIR",
+    "DBUS_SESSION_BUS_ADDRESS", "SSL_CERT_FILE", "SSL_CERT_DIR",
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "no_proxy",
+)
+
+
+def gh_env() -> dict[str, str]:
+    """Build a minimal environment for gh subprocesses."""
+    env = {name: os.environ[name] for name in GH_ENV_VARS if name in os.environ}
+    env["LC_ALL"] = "C"
+    return env
+
+
+def read_gh_available_cache() -> bool:
+    """Check for a fresh cached successful `gh auth status`."""
+    try:
+        if time.time() - GH_AVAILABLE_CACHE.stat().st_mtime > GH_AVAILABLE_TTL:
+            return False
+        return GH_AVAILABLE_CACHE.read_text().strip() == "1"
+    except OSError:
+        return False
+
+
+def write_gh_available_cache() -> None:
+    """Record that gh is available, replacing any previous marker atomically."""
+    write_cache_file(GH_AVAILABLE_CACHE, "1")
+
 
 def is_gh_available() -> bool:
     """Check if gh CLI is installed and authenticated."""
@@ -46,16 +91,25 @@ def is_gh_available() -> bool:
     if _gh_available is not None:
         return _gh_available
 
+    if read_gh_available_cache():
+        _gh_available = True
+        return _gh_available
+
     try:
         result = subprocess.run(
             ["gh", "auth", "status"],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            env=gh_env(),
+            timeout=GH_TIMEOUT,
         )
         _gh_available = result.returncode == 0
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         _gh_available = False
 
+    if _gh_available:
+        write_gh_available_cache()
     return _gh_available
 
 
@@ -72,21 +126,45 @@ def show_gh_warning() -> str | None:
 
 def get_github_remote(repo_path: Path) -> tuple[str, str] | None:
     """Get GitHub owner/repo from a repository's remote."""
+    git_dir = resolve_git_dir(repo_path)
+    if not git_dir:
+        return None
+
+    # Read remotes straight from .git/config, no need to load the repo
+    config = configparser.ConfigParser(
+        strict=False,
+        allow_no_value=True,
+        interpolation=None,
+        inline_comment_prefixes=("#", ";"),
+    )
     try:
-        repo = Repo(repo_path)
-    except InvalidGitRepositoryError:
+        text = (resolve_common_dir(git_dir) / "config").read_text(encoding="utf-8")
+        # Indentation means nothing to git, but configparser would treat a
+        # deeper indented line as a continuation of the previous value
+        config.read_string("\n".join(line.strip() for line in text.splitlines()))
+    except (OSError, configparser.Error, UnicodeDecodeError):
         return None
 
-    for remote in repo.remotes:
-        url = remote.url
+    for section in config.sections():
+        # Git section names are case-insensitive
+        if not section.lower().startswith('remote "'):
+            continue
+
+        url = config[section].get("url")
+        if not url:
+            continue
+
+        # Values may be quoted: url = "git@github.com:owner/repo.git"
+        if len(url) >= 2 and url[0] == url[-1] == '"':
+            url = url[1:-1]
 
         # Handle SSH URLs: git@github.com:owner/repo.git
-        ssh_match = re.match(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$", url)
+        ssh_match = _SSH_RE.match(url)
         if ssh_match:
             return ssh_match.group(1), ssh_match.group(2)
 
         # Handle HTTPS URLs: https://github.com/owner/repo.git
-        https_match = re.match(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?$", url)
+        https_match = _HTTPS_RE.match(url)
         if https_match:
             return https_match.group(1), https_match.group(2)
 
@@ -100,74 +178,118 @@ def parse_datetime(dt_str: str) -> datetime:
     return datetime.fromisoformat(dt_str)
 
 
-def fetch_prs(
-    repo_path: Path,
-    since: datetime,
-) -> RepoPRs:
-    """Fetch PRs for a repository using gh CLI."""
-    result = RepoPRs(
-        repo_path=repo_path,
-        repo_name=repo_path.name,
-        owner="",
-        prs_opened=[],
-        prs_merged=[],
+# Repos per GraphQL request, keeps each query well under GitHub's node limit
+PR_BATCH_SIZE = 20
+
+PR_FIELDS = "number title state createdAt mergedAt url"
+
+
+def build_pr_query(count: int) -> str:
+    """Build a GraphQL document with one aliased PR search per repository."""
+    params = ", ".join(f"$q{i}: String!" for i in range(count))
+    searches = "\n".join(
+        f"  r{i}: search(query: $q{i}, type: ISSUE, first: 100) "
+        f"{{ nodes {{ ... on PullRequest {{ {PR_FIELDS} }} }} }}"
+        for i in range(count)
     )
+    return f"query({params}) {{\n{searches}\n}}"
 
-    if not is_gh_available():
-        result.error = show_gh_warning()
-        return result
 
-    github_info = get_github_remote(repo_path)
-    if not github_info:
-        # Not a GitHub repo, skip silently
-        return result
+def add_pr(result: RepoPRs, pr: dict, since: datetime) -> None:
+    """Add a PR from gh output to the opened/merged lists if in range."""
+    created_at = parse_datetime(pr["createdAt"])
+    merged_at = parse_datetime(pr["mergedAt"]) if pr.get("mergedAt") else None
+
+    pr_info = PRInfo(
+        number=pr["number"],
+        title=pr["title"][:80],
+        state=pr["state"],
+        created_at=created_at,
+        merged_at=merged_at,
+        url=pr["url"],
+    )
+
+    # Check if PR was opened in our time range
+    if created_at >= since:
+        result.prs_opened.append(pr_info)
+
+    # Check if PR was merged in our time range
+    if merged_at and merged_at >= since:
+        result.prs_merged.append(pr_info)
 
-    owner, repo_name = github_info
-    result.owner = owner
-    result.repo_name = repo_name
+
+def fetch_prs_batch(
+    repos_with_remotes: list[tuple[Path, str, str]],
+    since: datetime,
+) -> list[RepoPRs]:
+    """Fetch PRs for several GitHub repositories with one GraphQL request.
+
+    Takes (path, owner, name) tuples, at most PR_BATCH_SIZE of them.
+    """
+    results = [
+        RepoPRs(repo_path=path, repo_name=name, owner=owner, prs_opened=[], prs_merged=[])
+        for path, owner, name in repos_with_remotes
+    ]
+
+    if not results:
+        return results
+
+    if not is_gh_available():
+        error = show_gh_warning()
+        for result in results:
+            result.error = error
+        return results
+
+    # PRs authored by the authenticated user (@me) that were touched in range;
+    # "updated" covers both opened and merged, exact filtering happens in add_pr
+    cmd = ["gh", "api", "graphql", "-F", "query=@-"]
+    for i, (_, owner, name) in enumerate(repos_with_remotes):
+        cmd += ["-f", f"q{i}=repo:{owner}/{name} is:pr author:@me updated:>={since.date().isoformat()}"]
 
     try:
-        # Fetch PRs authored by the authenticated user (@me)
-        cmd = [
-            "gh", "pr", "list",
-            "--repo", f"{owner}/{repo_name}",
-            "--author", "@me",
-            "--state", "all",
-            "--json", "number,title,state,createdAt,mergedAt,url",
-            "--limit", "100",
-        ]
-
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode != 0:
-            result.error = f"gh error: {proc.stderr.strip()}"
-            return result
-
-        prs_data = json.loads(proc.stdout) if proc.stdout.strip() else []
-
-        for pr in prs_data:
-            created_at = parse_datetime(pr["createdAt"])
-            merged_at = parse_datetime(pr["mergedAt"]) if pr.get("mergedAt") else None
-
-            pr_info = PRInfo(
-                number=pr["number"],
-                title=pr["title"][:80],
-                state=pr["state"],
-                created_at=created_at,
-                merged_at=merged_at,
-                url=pr["url"],
-            )
-
-            # Check if PR was opened in our time range
-            if created_at >= since:
-                result.prs_opened.append(pr_info)
-
-            # Check if PR was merged in our time range
-            if merged_at and merged_at >= since:
-                result.prs_merged.append(pr_info)
+        proc = subprocess.run(
+            cmd,
+            input=build_pr_query(len(results)),
+            capture_output=True,
+            encoding="utf-8",
+            env=gh_env(),
+            timeout=GH_TIMEOUT,
+        )
 
+        # GraphQL errors still come with partial data for the other repos
+        payload = json.loads(proc.stdout) if proc.stdout.strip() else {}
+        data = payload.get("data") or {}
+        if proc.returncode != 0 and not data:
+            raise RuntimeError(f"gh error: {proc.stderr.strip()}")
+
+        alias_errors = {
+            error["path"][0]: error.get("message", "unknown error")
+            for error in payload.get("errors", [])
+            if error.get("path")
+        }
+
+        for i, result in enumerate(results):
+            alias = f"r{i}"
+            if alias in alias_errors:
+                result.error = f"gh error: {alias_errors[alias]}"
+                continue
+
+            for pr in (data.get(alias) or {}).get("nodes", []):
+                if pr:
+                    add_pr(result, pr, since)
+
+            # Newest first, so callers can slice by date
+            result.prs_opened.sort(key=lambda p: p.created_at, reverse=True)
+            result.prs_merged.sort(key=lambda p: p.merged_at, reverse=True)
+
+    except subprocess.TimeoutExpired:
+        for result in results:
+            result.error = f"gh timed out after {GH_TIMEOUT}s"
     except json.JSONDecodeError as e:
-        result.error = f"Failed to parse gh output: {e}"
+        for result in results:
+            result.error = f"Failed to parse gh output: {e}"
     except Exception as e:
-        result.error = str(e)
+        for result in results:
+            result.error = str(e)
 
-    return result
+    return results
@@ -1,10 +1,15 @@
 """Rich terminal report rendering."""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import cached_property
+from pathlib import Path
+import io
+import json
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
+from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
 
@@ -14,37 +19,37 @@ from .github_prs import RepoPRs
 
 @dataclass
 class PeriodStats:
-    """Aggregated statistics for a time period."""
+    """Aggregated statistics for a time period (totals computed once)."""
 
     name: str
     repo_stats: list[RepoStats]
     repo_prs: list[RepoPRs]
 
-    @property
+    @cached_property
     def total_commits(self) -> int:
         return sum(r.total_commits for r in self.repo_stats)
 
-    @property
+    @cached_property
     def repos_with_commits(self) -> int:
         return sum(1 for r in self.repo_stats if r.total_commits > 0)
 
-    @property
+    @cached_property
     def lines_added(self) -> int:
         return sum(r.lines_added for r in self.repo_stats)
 
-    @property
+    @cached_property
     def lines_removed(self) -> int:
         return sum(r.lines_removed for r in self.repo_stats)
 
-    @property
+    @cached_property
     def files_changed(self) -> int:
         return sum(r.files_changed for r in self.repo_stats)
 
-    @property
+    @cached_property
     def prs_opened(self) -> int:
         return sum(len(r.prs_opened) for r in self.repo_prs)
 
-    @property
+    @cached_property
     def prs_merged(self) -> int:
         return sum(len(r.prs_merged) for r in self.repo_prs)
 
@@ -66,16 +71,18 @@ def format_lines(added: int, removed: int, pad_added: int = 0, pad_removed: int
     return text
 
 
-def render_period(console: Console, period: PeriodStats) -> None:
+def render_period(period: PeriodStats) -> Group:
     """Render a single time period's statistics."""
     # Header
-    console.print()
-    console.rule(f"[bold cyan]{period.name}[/bold cyan]", style="cyan")
-    console.print()
+    items: list[RenderableType] = [
+        "",
+        Rule(f"[bold cyan]{period.name}[/bold cyan]", style="cyan"),
+        "",
+    ]
 
     if period.total_commits == 0 and period.prs_opened == 0 and period.prs_merged == 0:
-        console.print("[dim]No activity[/dim]")
-        return
+        items.append("[dim]No activity[/dim]")
+        return Group(*items)
 
     # Summary line
     summary = Text()
@@ -89,7 +96,7 @@ def render_period(console: Console, period: PeriodStats) -> None:
     summary.append("  |  PRs Merged: ", style="bold")
     summary.append(fmt(period.prs_merged))
 
-    console.print(summary)
+    items.append(summary)
 
     # Lines summary
     if period.lines_added > 0 or period.lines_removed > 0:
@@ -98,12 +105,12 @@ def render_period(console: Console, period: PeriodStats) -> None:
         lines_summary.append_text(format_lines(period.lines_added, period.lines_removed))
         lines_summary.append("  |  Files: ", style="bold")
         lines_summary.append(fmt(period.files_changed))
-        console.print(lines_summary)
+        items.append(lines_summary)
 
     # Per-repo breakdown (only repos with activity)
     active_repos = [r for r in period.repo_stats if r.total_commits > 0]
     if active_repos:
-        console.print()
+        items.append("")
 
         # Calculate max widths for alignment
         sorted_repos = sorted(active_repos, key=lambda r: r.total_commits, reverse=True)
@@ -122,7 +129,9 @@ def render_period(console: Console, period: PeriodStats) -> None:
                 format_lines(repo.lines_added, repo.lines_removed, max_added_width, max_removed_width),
             )
 
-        console.print(table)
+        items.append(table)
+
+    return Group(*items)
 
 
 def render_report(
@@ -130,7 +139,7 @@ def render_report(
     periods: list[PeriodStats],
     warnings: list[str],
 ) -> None:
-    """Render the full report."""
+    """Render the full report with a single write to the console."""
     # Header
     now = datetime.now(timezone.utc)
     header = Text()
@@ -138,15 +147,61 @@ def render_report(
     header.append(" - Generated ")
     header.append(now.strftime("%Y-%m-%d %H:%M UTC"), style="dim")
 
-    console.print()
-    console.print(Panel(header, border_style="magenta"))
+    items: list[RenderableType] = ["", Panel(header, border_style="magenta")]
 
     # Warnings
     for warning in warnings:
-        console.print(f"[yellow]Warning:[/yellow] {warning}")
+        items.append(f"[yellow]Warning:[/yellow] {warning}")
 
     # Each period
     for period in periods:
-        render_period(console, period)
-
-    console.print()
+        items.append(render_period(period))
+
+    items.append("")
+
+    # Lay everything out off-screen with the same settings, then emit it
+    # to the terminal in one write
+    buffer_console = Console(
+        file=io.StringIO(),
+        width=console.size.width,
+        force_terminal=console.is_terminal,
+        color_system=console.color_system,
+    )
+    buffer_console.print(Group(*items))
+
+    console.file.write(buffer_console.file.getvalue())
+    console.file.flush()
+
+
+def json_default(obj: object) -> str:
+    """Serialize the non-JSON types found in report dataclasses."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def render_json(periods: list[PeriodStats], warnings: list[str]) -> str:
+    """Render the full report as JSON, skipping Rich entirely."""
+    data = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "warnings": warnings,
+        "periods": [
+            {
+                "name": period.name,
+                "total_commits": period.total_commits,
+                "repos_with_commits": period.repos_with_commits,
+                "lines_added": period.lines_added,
+                "lines_removed": period.lines_removed,
+                "files_changed": period.files_changed,
+                "prs_opened": period.prs_opened,
+                "prs_merged": period.prs_merged,
+                # Only repos with activity, like the terminal report
+                "repos": [asdict(r) for r in period.repo_stats if r.total_commits > 0],
+                "prs": [asdict(r) for r in period.repo_prs if r.prs_opened or r.prs_merged],
+            }
+            for period in periods
+        ],
+    }
+    return json.dumps(data, default=json_default, indent=2)